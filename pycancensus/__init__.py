@@ -37,6 +37,7 @@ from .settings import (
 )
 from .geometry import get_census_geometry
 from .cache import list_cache, remove_from_cache, clear_cache
+from .resilience import close_session
 from .recalls import (
     get_recalled_database,
     list_recalled_cached_data,
@@ -61,6 +62,7 @@ __all__ = [
     "show_api_key",
     "set_cache_path",
     "get_cache_path",
+    "close_session",
     "get_census_geometry",
     "list_cache",
     "remove_from_cache",
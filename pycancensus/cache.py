@@ -7,13 +7,25 @@ import json
 import warnings
 import pickle
 import hashlib
+import sys
 from pathlib import Path
 from typing import Any, Optional, List
 import pandas as pd
-import geopandas as gpd
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
 
 from .settings import get_cache_path
 
+# DataFrames and GeoDataFrames are cached as parquet when pyarrow is
+# available, since it loads much faster than unpickling; everything else is
+# pickled. Lookups try both, so entries written by either format stay
+# readable.
+_CACHE_SUFFIXES = (".parquet", ".pkl")
+
 # In-memory session cache for metadata (vector and region lists). Sits in
 # front of the file cache so repeated calls within a session don't pay the
 # disk read + unpickle cost on every access.
@@ -48,6 +60,69 @@ def _session_cache_remove(cache_keys: Optional[List[str]] = None) -> None:
             _session_cache.pop(cache_key, None)
 
 
+def _cache_files(cache_path: Path, cache_key: str) -> List[Path]:
+    """Candidate data files for a cache key, in lookup order."""
+    return [cache_path / f"{cache_key}{suffix}" for suffix in _CACHE_SUFFIXES]
+
+
+def _is_geodataframe(data: Any) -> bool:
+    """Check for a GeoDataFrame without importing geopandas."""
+    gpd = sys.modules.get("geopandas")
+    return gpd is not None and isinstance(data, gpd.GeoDataFrame)
+
+
+def _write_parquet(data: Any, cache_file: Path) -> bool:
+    """Cache a DataFrame as parquet; return False if it should be pickled.
+
+    Only DataFrames and GeoDataFrames (as GeoParquet) are written, and only
+    if every object column holds strings (the default string dtype before
+    pandas 3); other object columns could not round-trip exactly.
+    """
+    if pyarrow is None:
+        return False
+    if type(data) is not pd.DataFrame and not _is_geodataframe(data):
+        return False
+    for col in data.columns[data.dtypes == object]:
+        if pd.api.types.infer_dtype(data[col], skipna=True) not in ("string", "empty"):
+            return False
+    try:
+        data.to_parquet(cache_file, compression="zstd")
+    except Exception:
+        cache_file.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def _restore_object_columns(frame: pd.DataFrame, metadata: dict) -> pd.DataFrame:
+    """Give object string columns back their dtype after a parquet read.
+
+    pandas 3 reads every parquet string column as its ``str`` dtype, even
+    ones written from object columns; the pandas schema metadata records
+    which columns were object.
+    """
+    pandas_metadata = json.loads(metadata.get(b"pandas", b"{}"))
+    for column in pandas_metadata.get("columns", []):
+        name = column.get("name")
+        if column.get("numpy_type") != "object" or name not in frame.columns:
+            continue
+        if isinstance(frame[name].dtype, pd.StringDtype):
+            values = frame[name].astype(object)
+            frame[name] = values.where(values.notna(), None)
+    return frame
+
+
+def _read_parquet(cache_file: Path) -> pd.DataFrame:
+    """Load a parquet cache entry, as a GeoDataFrame if it holds geometry."""
+    metadata = pyarrow.parquet.read_schema(cache_file).metadata or {}
+    if b"geo" in metadata:
+        import geopandas as gpd
+
+        frame = gpd.read_parquet(cache_file)
+    else:
+        frame = pd.read_parquet(cache_file, engine="pyarrow")
+    return _restore_object_columns(frame, metadata)
+
+
 def get_cached_data(cache_key: str) -> Optional[Any]:
     """
     Retrieve data from cache if it exists.
@@ -63,10 +138,13 @@ def get_cached_data(cache_key: str) -> Optional[Any]:
         Cached data if found, None otherwise.
     """
     cache_path = Path(get_cache_path())
-    cache_file = cache_path / f"{cache_key}.pkl"
 
-    if cache_file.exists():
+    for cache_file in _cache_files(cache_path, cache_key):
+        if not cache_file.exists():
+            continue
         try:
+            if cache_file.suffix == ".parquet":
+                return _read_parquet(cache_file)
             with open(cache_file, "rb") as f:
                 return pickle.load(f)
         except Exception:
@@ -94,11 +172,16 @@ def cache_data(cache_key: str, data: Any, metadata: Optional[dict] = None) -> No
     cache_path = Path(get_cache_path())
     cache_path.mkdir(parents=True, exist_ok=True)
 
-    cache_file = cache_path / f"{cache_key}.pkl"
+    parquet_file, pickle_file = _cache_files(cache_path, cache_key)
 
     try:
-        with open(cache_file, "wb") as f:
-            pickle.dump(data, f)
+        # Drop the other format's file so a stale entry can't shadow this one
+        if _write_parquet(data, parquet_file):
+            pickle_file.unlink(missing_ok=True)
+        else:
+            with open(pickle_file, "wb") as f:
+                pickle.dump(data, f)
+            parquet_file.unlink(missing_ok=True)
         if metadata is not None:
             meta_file = cache_path / f"{cache_key}.meta.json"
             with open(meta_file, "w") as f:
@@ -146,19 +229,29 @@ def list_cache() -> pd.DataFrame:
             columns=["cache_key", "file_path", "size_mb", "created", "modified"]
         )
 
+    # One directory pass; sidecars are only opened for names it found
+    with os.scandir(cache_path) as it:
+        dir_entries = sorted(it, key=lambda dir_entry: dir_entry.name)
+    names = {dir_entry.name for dir_entry in dir_entries}
+
     cache_files = []
 
-    for cache_file in cache_path.glob("*.pkl"):
+    for dir_entry in dir_entries:
+        cache_key, suffix = os.path.splitext(dir_entry.name)
+        if suffix not in _CACHE_SUFFIXES:
+            continue
         try:
-            stat = cache_file.stat()
+            stat = dir_entry.stat()
             entry = {
-                "cache_key": cache_file.stem,
-                "file_path": str(cache_file),
+                "cache_key": cache_key,
+                "file_path": dir_entry.path,
                 "size_mb": round(stat.st_size / (1024 * 1024), 2),
                 "created": pd.Timestamp.fromtimestamp(stat.st_ctime),
                 "modified": pd.Timestamp.fromtimestamp(stat.st_mtime),
             }
-            metadata = get_cache_metadata(cache_file.stem)
+            metadata = None
+            if f"{cache_key}.meta.json" in names:
+                metadata = get_cache_metadata(cache_key)
             if metadata is not None:
                 for key in ("dataset", "level", "vectors", "version", "geo_version"):
                     entry[key] = metadata.get(key)
@@ -207,8 +300,10 @@ def remove_from_cache(
     removed_count = 0
 
     if all_cache:
-        # Remove all .pkl files (and their metadata sidecars)
-        for cache_file in cache_path.glob("*.pkl"):
+        # Remove all cached data files (and their metadata sidecars)
+        for cache_file in [
+            file for suffix in _CACHE_SUFFIXES for file in cache_path.glob(f"*{suffix}")
+        ]:
             try:
                 cache_file.unlink()
                 (cache_path / f"{cache_file.stem}.meta.json").unlink(missing_ok=True)
@@ -221,10 +316,13 @@ def remove_from_cache(
     elif cache_keys:
         # Remove specific cache keys
         for cache_key in cache_keys:
-            cache_file = cache_path / f"{cache_key}.pkl"
-            if cache_file.exists():
+            cache_files = [
+                file for file in _cache_files(cache_path, cache_key) if file.exists()
+            ]
+            if cache_files:
                 try:
-                    cache_file.unlink()
+                    for cache_file in cache_files:
+                        cache_file.unlink()
                     (cache_path / f"{cache_key}.meta.json").unlink(missing_ok=True)
                     removed_count += 1
                     print(f"Removed cache: {cache_key}")
@@ -2,23 +2,45 @@
 Core functionality for accessing Canadian Census data through the CensusMapper API.
 """
 
+import csv
 import hashlib
 import io
 import json
+import logging
+import re
+import threading
 import warnings
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
-import geopandas as gpd
 import requests
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is the fallback
+    orjson = None
+
 from .settings import get_api_key, get_cache_path, CENSUSMAPPER_API_URL
 from .resilience import get_session
 from .cache import get_cached_data, cache_data
 from .utils import validate_dataset, validate_level, process_regions
 from .progress import show_request_preview, create_progress_for_request
 
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    # geopandas is imported lazily; only geometry requests need it
+    import geopandas as gpd
+
 
 def get_census(
     dataset: str,
@@ -31,7 +53,8 @@ def get_census(
     use_cache: bool = True,
     quiet: bool = False,
     api_key: Optional[str] = None,
-) -> Union[pd.DataFrame, gpd.GeoDataFrame]:
+    downcast: bool = False,
+) -> Union[pd.DataFrame, "gpd.GeoDataFrame"]:
     """
     Access Canadian census data through the CensusMapper API.
 
@@ -47,7 +70,8 @@ def get_census(
         aggregation levels.
     vectors : list of str, optional
         CensusMapper variable names of the census variables to download.
-        If None, only geographic data will be downloaded.
+        Any array-like of strings (e.g. a pandas Series or NumPy array) is
+        accepted. If None, only geographic data will be downloaded.
     level : str, default 'Regions'
         The census aggregation level to retrieve. One of 'Regions', 'PR',
         'CMA', 'CD', 'CSD', 'CT', 'DA', 'EA' (for 1996), or 'DB' (for 2001-2021).
@@ -65,6 +89,10 @@ def get_census(
     api_key : str, optional
         API key for CensusMapper API. If None, uses environment variable
         or previously set key.
+    downcast : bool, default False
+        If True, store int64 columns as int32 and float64 columns as float32
+        where every value fits exactly, roughly halving memory for large
+        downloads. Columns that would lose precision are left as they are.
 
     Returns
     -------
@@ -107,6 +135,13 @@ def get_census(
     # Process regions
     processed_regions = process_regions(regions)
 
+    # Accept any array-like of vector IDs; the request body and cache key
+    # need a plain list
+    if isinstance(vectors, str):
+        vectors = [vectors]
+    elif vectors is not None and not isinstance(vectors, list):
+        vectors = [str(vector) for vector in vectors]
+
     # Show request preview for large downloads
     if not quiet:
         show_request_preview(
@@ -127,6 +162,8 @@ def get_census(
             check_recalled_data_and_warn(cache_key)
             # Process labels for cached data
             cached_data = _extract_vector_metadata(cached_data, vectors, labels)
+            if downcast:
+                cached_data = _downcast_numeric_columns(cached_data)
             return cached_data
 
     # Build API request exactly like the R package
@@ -172,63 +209,75 @@ def get_census(
         if progress:
             progress.start()
 
-        # Handle geo_format='geopandas' with vectors using hybrid approach
-        if geo_format == "geopandas" and vectors:
-            # The geo.geojson endpoint doesn't properly return vector data
-            # Use dedicated function to fetch and merge geo + vector data
-            result, data_version, geo_version = _fetch_census_with_geometry_and_vectors(
-                base_url, request_data, resolution, vectors, labels
-            )
-        else:
-            # Standard single-endpoint approach
-            if geo_format == "geopandas":
-                endpoint = "geo.geojson"
-                if resolution == "high":
-                    request_data["resolution"] = "high"
+        def download():
+            # Handle geo_format='geopandas' with vectors using hybrid approach
+            if geo_format == "geopandas" and vectors:
+                # The geo.geojson endpoint doesn't properly return vector data
+                # Use dedicated function to fetch and merge geo + vector data
+                result, data_version, geo_version = (
+                    _fetch_census_with_geometry_and_vectors(
+                        base_url, request_data, resolution, vectors, labels
+                    )
+                )
             else:
-                endpoint = "data.csv"
-
-            # Use multipart/form-data like the R package
-            # Convert all values to tuple format for multipart encoding
-            multipart_data = {}
-            for key, value in request_data.items():
-                multipart_data[key] = (None, value)
+                # Standard single-endpoint approach
+                if geo_format == "geopandas":
+                    endpoint = "geo.geojson"
+                    if resolution == "high":
+                        request_data["resolution"] = "high"
+                else:
+                    endpoint = "data.csv"
+
+                # Use multipart/form-data like the R package
+                # Convert all values to tuple format for multipart encoding
+                multipart_data = {}
+                for key, value in request_data.items():
+                    multipart_data[key] = (None, value)
+
+                response = get_session().post(
+                    f"{base_url}{endpoint}", files=multipart_data
+                )
 
-            response = get_session().post(f"{base_url}{endpoint}", files=multipart_data)
+                # Track the server data version for recalled-data detection
+                data_version = None
+                geo_version = None
+                if geo_format == "geopandas":
+                    geo_version = response.headers.get("data-version")
+                else:
+                    data_version = response.headers.get("data-version")
+
+                # Process the response data based on endpoint
+                if geo_format == "geopandas":
+                    # geo.geojson returns JSON
+                    result = _read_geojson_response(response, vectors, labels)
+                else:
+                    # data.csv returns CSV
+                    result = _process_csv_response(response.text, vectors, labels)
+
+            # Cache the result. use_cache=False means "don't read stale data",
+            # not "don't cache": a forced refresh still updates the cache,
+            # matching the R package. Metadata enables recalled-data detection.
+            cache_data(
+                cache_key,
+                result,
+                metadata={
+                    "dataset": dataset,
+                    "regions": regions_for_json,
+                    "level": level,
+                    "vectors": list(vectors) if vectors else [],
+                    "created_at": datetime.now().isoformat(),
+                    "version": data_version,
+                    "geo_version": geo_version,
+                },
+            )
+            return result
 
-            # Track the server data version for recalled-data detection
-            data_version = None
-            geo_version = None
-            if geo_format == "geopandas":
-                geo_version = response.headers.get("data-version")
-            else:
-                data_version = response.headers.get("data-version")
+        # Identical requests already in flight share one download
+        result = _single_flight((cache_key, resolution, labels), download)
 
-            # Process the response data based on endpoint
-            if geo_format == "geopandas":
-                # geo.geojson returns JSON
-                data = response.json()
-                result = _process_geojson_response(data, vectors, labels)
-            else:
-                # data.csv returns CSV
-                result = _process_csv_response(response.text, vectors, labels)
-
-        # Cache the result. use_cache=False means "don't read stale data",
-        # not "don't cache": a forced refresh still updates the cache,
-        # matching the R package. Metadata enables recalled-data detection.
-        cache_data(
-            cache_key,
-            result,
-            metadata={
-                "dataset": dataset,
-                "regions": regions_for_json,
-                "level": level,
-                "vectors": list(vectors) if vectors else [],
-                "created_at": datetime.now().isoformat(),
-                "version": data_version,
-                "geo_version": geo_version,
-            },
-        )
+        # Downcast after caching so cached data doesn't depend on the flag
+        if downcast:
+            result = _downcast_numeric_columns(result)
 
         # Finish progress indicator
         if progress:
@@ -254,6 +303,47 @@ def get_census(
         raise RuntimeError(f"Failed to process API response: {e}")
 
 
+# get_census downloads in progress, keyed by request. Concurrent identical
+# calls wait on the first caller's Future instead of repeating the request.
+_inflight: Dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _single_flight(key, fetch):
+    """Run ``fetch()`` once per key across concurrent callers.
+
+    The first caller for a key runs the download and gets its result;
+    callers arriving while it is in flight block until it finishes. They
+    get their own copy of a private snapshot, so no caller shares a
+    DataFrame with another. If the download fails, every waiting caller
+    re-raises the leader's exception instance, as
+    ``concurrent.futures.Future.result()`` does; its traceback therefore
+    reflects whichever thread raised it last.
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = _inflight[key] = Future()
+
+    if not is_leader:
+        return future.result().copy()
+
+    try:
+        result = fetch()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        # Waiters copy from a snapshot the leader's caller never sees, so
+        # they can't race with that caller mutating its result
+        future.set_result(result.copy())
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
 def _generate_cache_key(dataset, regions, vectors, level, geo_format):
     """Generate a cache key for the given parameters."""
     # Create a string representation of the parameters
@@ -308,8 +398,7 @@ def _fetch_census_with_geometry_and_vectors(
         f"{base_url}geo.geojson", files=geo_multipart_data
     )
     geo_version = geo_response.headers.get("data-version")
-    geo_data = geo_response.json()
-    geo_result = _process_geojson_response(geo_data, None, labels)
+    geo_result = _read_geojson_response(geo_response, None, labels)
 
     # 2. Fetch vector data using CSV endpoint
     csv_multipart_data = {key: (None, value) for key, value in request_data.items()}
@@ -322,9 +411,9 @@ def _fetch_census_with_geometry_and_vectors(
 
 
 def _merge_geo_and_csv_results(
-    geo_result: gpd.GeoDataFrame,
+    geo_result: "gpd.GeoDataFrame",
     csv_result: pd.DataFrame,
-) -> gpd.GeoDataFrame:
+) -> "gpd.GeoDataFrame":
     """
     Merge GeoDataFrame with CSV DataFrame on geographic identifier.
 
@@ -384,6 +473,23 @@ def _merge_geo_and_csv_results(
     return result
 
 
+def _downcast_numeric_columns(df):
+    """Downcast int64/float64 columns to 32-bit where no value changes."""
+    int32 = np.iinfo(np.int32)
+    dtypes = {}
+    for col in df.select_dtypes(include=["int64"]).columns:
+        values = df[col]
+        if values.empty or (values.min() >= int32.min and values.max() <= int32.max):
+            dtypes[col] = "int32"
+    for col in df.select_dtypes(include=["float64"]).columns:
+        values = df[col].to_numpy()
+        narrowed = values.astype("float32")
+        # NaN never equals itself, so compare only the observed values
+        if np.array_equal(narrowed, values, equal_nan=True):
+            dtypes[col] = "float32"
+    return df.astype(dtypes) if dtypes else df
+
+
 def _extract_vector_metadata(df, vectors, labels):
     """Extract vector metadata from column names and store as attribute."""
     if not vectors:
@@ -432,11 +538,28 @@ def _extract_vector_metadata(df, vectors, labels):
     return df
 
 
+# Census-specific NA values (matching R package)
+_CENSUS_NA_VALUES = ["x", "X", "F", "...", "-", ""]
+
+# Standard census columns that should be numeric
+# Include both long names (CSV endpoint) and short names (GeoJSON endpoint)
+_STANDARD_NUMERIC_COLUMNS = [
+    "Population",
+    "Households",
+    "Dwellings",
+    "Area (sq km)",
+    "pop",  # GeoJSON short name
+    "dw",  # GeoJSON short name
+    "hh",  # GeoJSON short name
+    "a",  # GeoJSON short name
+]
+
+
 def _normalize_census_dataframe(
-    df: Union[pd.DataFrame, gpd.GeoDataFrame],
+    df: Union[pd.DataFrame, "gpd.GeoDataFrame"],
     vectors: Optional[List[str]],
     labels: str,
-) -> Union[pd.DataFrame, gpd.GeoDataFrame]:
+) -> Union[pd.DataFrame, "gpd.GeoDataFrame"]:
     """
     Normalize a census DataFrame or GeoDataFrame.
 
@@ -460,25 +583,9 @@ def _normalize_census_dataframe(
     pd.DataFrame or gpd.GeoDataFrame
         The normalized data with proper dtypes.
     """
-    # Census-specific NA values (matching R package)
-    census_na_values = ["x", "X", "F", "...", "-", ""]
-
-    # Standard census columns that should be numeric
-    # Include both long names (CSV endpoint) and short names (GeoJSON endpoint)
-    standard_numeric = [
-        "Population",
-        "Households",
-        "Dwellings",
-        "Area (sq km)",
-        "pop",  # GeoJSON short name
-        "dw",  # GeoJSON short name
-        "hh",  # GeoJSON short name
-        "a",  # GeoJSON short name
-    ]
-
     # Find numeric columns to convert
     numeric_columns = []
-    for expected_col in standard_numeric:
+    for expected_col in _STANDARD_NUMERIC_COLUMNS:
         # Check for exact match
         if expected_col in df.columns:
             numeric_columns.append(expected_col)
@@ -494,10 +601,11 @@ def _normalize_census_dataframe(
         if col.startswith("v_"):
             numeric_columns.append(col)
 
-    # Convert to numeric with census NA handling
+    # Convert to numeric with census NA handling; columns the CSV reader
+    # already typed are left alone
     for col in numeric_columns:
-        if col in df.columns:
-            df[col] = df[col].replace(census_na_values, pd.NA)
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = df[col].replace(_CENSUS_NA_VALUES, pd.NA)
             df[col] = pd.to_numeric(df[col], errors="coerce")
 
     # Standard categorical columns
@@ -512,12 +620,14 @@ def _normalize_census_dataframe(
     for expected_col in categorical_columns:
         # Check for exact match
         if expected_col in df.columns:
-            df[expected_col] = df[expected_col].astype("category")
+            if not isinstance(df[expected_col].dtype, pd.CategoricalDtype):
+                df[expected_col] = df[expected_col].astype("category")
             continue
         # Check for variations with trailing/leading spaces
         for actual_col in df.columns:
             if actual_col.strip() == expected_col:
-                df[actual_col] = df[actual_col].astype("category")
+                if not isinstance(df[actual_col].dtype, pd.CategoricalDtype):
+                    df[actual_col] = df[actual_col].astype("category")
                 break
 
     # Extract vector metadata and handle labels
@@ -526,10 +636,79 @@ def _normalize_census_dataframe(
     return df
 
 
+# Columns read as categoricals while parsing, so they skip a separate
+# astype("category") pass
+_CSV_CATEGORICAL_COLUMNS = frozenset({"Type", "Region Name"})
+
+
+def _read_census_csv(csv_text):
+    """Read census CSV text into a DataFrame.
+
+    Uses pyarrow's multithreaded CSV reader when it is available. Column
+    types are pinned to string up front, because pandas' ``engine="pyarrow"``
+    infers types before casting and would turn GeoUIDs like "0101" into
+    "101.0"; numeric conversion is left to normalization. Otherwise the
+    pandas C parser types columns while parsing: numeric census columns with
+    the census NA markers, labels as categoricals, and everything else,
+    identifiers included, as strings. The ``Type`` and ``Region Name``
+    columns come back as categoricals on both paths.
+    """
+    header = next(csv.reader(io.StringIO(csv_text)), [])
+
+    if pa is not None:
+        categorical_type = pa.dictionary(pa.int32(), pa.string())
+        convert_options = pa_csv.ConvertOptions(
+            column_types={
+                name: (
+                    categorical_type
+                    if name.strip() in _CSV_CATEGORICAL_COLUMNS
+                    else pa.string()
+                )
+                for name in header
+            },
+            strings_can_be_null=True,
+        )
+        try:
+            table = pa_csv.read_csv(
+                io.BytesIO(csv_text.encode("utf-8")),
+                convert_options=convert_options,
+            )
+        except pa.ArrowInvalid:
+            pass
+        else:
+            df = table.to_pandas()
+            # Arrow keeps categories in order of first appearance; sort them
+            # to match astype("category")
+            for col in df.select_dtypes("category"):
+                df[col] = df[col].cat.set_categories(
+                    df[col].cat.categories.sort_values()
+                )
+            return df
+
+    dtype = {}
+    na_values = {}
+    for name in header:
+        stripped = name.strip()
+        if stripped in _STANDARD_NUMERIC_COLUMNS or stripped.startswith("v_"):
+            na_values[name] = _CENSUS_NA_VALUES
+        elif stripped in _CSV_CATEGORICAL_COLUMNS:
+            dtype[name] = "category"
+        else:
+            dtype[name] = str
+
+    return pd.read_csv(
+        io.StringIO(csv_text),
+        dtype=dtype,
+        na_values=na_values,
+        encoding="utf-8",
+        engine="c",
+        low_memory=False,
+    )
+
+
 def _process_csv_response(csv_text, vectors, labels):
     """Process CSV API response into a pandas DataFrame."""
-    # Read all columns as strings initially (like R package)
-    df = pd.read_csv(io.StringIO(csv_text), dtype=str, encoding="utf-8")
+    df = _read_census_csv(csv_text)
 
     # Fix column names by removing trailing/leading spaces (critical fix for API compatibility)
     df.columns = df.columns.str.strip()
@@ -557,11 +736,96 @@ def _process_json_response(data, vectors, labels):
     return _normalize_census_dataframe(df, vectors, labels)
 
 
+# GDAL would otherwise turn ISO-date-like strings into dates, which
+# GeoDataFrame.from_features leaves as strings
+_GEOJSON_OPEN_OPTIONS = {"DATE_AS_STRING": "YES"}
+
+# A feature "properties" object with an "id" member. GDAL also fills an "id"
+# field from string feature ids, which from_features ignores.
+_ID_PROPERTY_RE = re.compile(rb'"properties"\s*:\s*\{[^{}]*"id"\s*:')
+
+
+def _read_geojson_response(response, vectors, labels):
+    """Read a geo.geojson API response into a GeoDataFrame.
+
+    Parses the raw bytes with pyogrio when it is available (through Arrow
+    when pyarrow and GDAL >= 3.6 are), which avoids building a Python dict
+    per feature. Falls back to decoding the JSON (with orjson when
+    installed) when pyogrio is missing, cannot read the payload, or the
+    payload holds values GDAL would represent differently from
+    ``GeoDataFrame.from_features``.
+    """
+    try:
+        import pyogrio
+    except ImportError:  # geopandas < 1.0 does not depend on pyogrio
+        pyogrio = None
+
+    if pyogrio is not None:
+        use_arrow = pa is not None and pyogrio.__gdal_version__ >= (3, 6, 0)
+        try:
+            gdf = _read_geojson_with_pyogrio(pyogrio, response.content, use_arrow)
+        except (pyogrio.errors.DataSourceError, pyogrio.errors.DataLayerError) as e:
+            logger.debug("pyogrio could not read GeoJSON response: %s", e)
+            gdf = None
+
+        if gdf is not None:
+            return _normalize_census_dataframe(gdf, vectors, labels)
+
+    return _process_geojson_response(_load_json(response), vectors, labels)
+
+
+def _read_geojson_with_pyogrio(pyogrio, content, use_arrow):
+    """Read GeoJSON bytes into the frame ``GeoDataFrame.from_features`` builds.
+
+    Returns None when the payload needs ``from_features`` to be reproduced
+    exactly: properties GDAL stores as JSON or list fields (nested, or mixing
+    value types), or an "id" field that only comes from feature ids.
+    """
+    import geopandas as gpd
+
+    if use_arrow:
+        meta, table = pyogrio.read_arrow(content, **_GEOJSON_OPEN_OPTIONS)
+        geometry_name = meta["geometry_name"] or "wkb_geometry"
+        wkb = table.column(geometry_name).to_numpy(zero_copy_only=False)
+        df = table.drop_columns([geometry_name]).to_pandas()
+    else:
+        meta, _, wkb, field_data = pyogrio.raw.read(content, **_GEOJSON_OPEN_OPTIONS)
+        df = pd.DataFrame(dict(zip(meta["fields"], field_data)))
+    logger.debug("Read GeoJSON response with pyogrio (use_arrow=%s)", use_arrow)
+
+    if "OFSTJSON" in meta["ogr_subtypes"] or any(
+        ogr_type.endswith("List") for ogr_type in meta["ogr_types"]
+    ):
+        logger.debug("GeoJSON properties need from_features; not using pyogrio")
+        return None
+    if "id" in df.columns and not _ID_PROPERTY_RE.search(content):
+        logger.debug("GeoJSON 'id' comes from feature ids; not using pyogrio")
+        return None
+
+    # Match GeoDataFrame.from_features: int64 counts, all-null properties as
+    # object columns of None, geometry first
+    df = df.astype({col: "int64" for col in df.columns[df.dtypes == "int32"]})
+    if len(df):
+        for col in df.columns[df.isna().all()]:
+            df[col] = pd.Series([None] * len(df), index=df.index, dtype=object)
+    geometry = gpd.GeoSeries.from_wkb(wkb, index=df.index, crs="EPSG:4326")
+    return gpd.GeoDataFrame(df, geometry=geometry)[["geometry", *df.columns]]
+
+
+def _load_json(response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def _process_geojson_response(data, vectors, labels):
     """Process GeoJSON API response into a GeoDataFrame."""
     if "features" not in data:
         raise ValueError("Invalid GeoJSON response: missing 'features' field")
 
+    import geopandas as gpd
+
     gdf = gpd.GeoDataFrame.from_features(data["features"], crs="EPSG:4326")
 
     # Apply shared normalization
@@ -10,7 +10,10 @@ import requests
 
 from .settings import get_api_key, CENSUSMAPPER_API_URL
 from .resilience import get_session
-from .cache import get_cached_data, cache_data
+from .cache import get_cached_data, cache_data, session_cache_get, session_cache_set
+
+# Four-digit years in attribution text, merged across datasets
+_YEAR_RE = re.compile(r"\d{4}")
 
 
 def list_census_datasets(
@@ -51,13 +54,19 @@ def list_census_datasets(
                 "environment variable."
             )
 
-    # Check cache first
+    # Check caches first: in-memory session cache, then file cache.
+    # dataset_attribution() calls this on every use, so repeat calls in a
+    # session skip the disk read
+    cache_key = "datasets"
     if use_cache:
-        cache_key = "datasets"
+        cached_data = session_cache_get(cache_key)
+        if cached_data is not None:
+            return cached_data
         cached_data = get_cached_data(cache_key)
         if cached_data is not None:
             if not quiet:
                 print("Reading datasets from cache...")
+            session_cache_set(cache_key, cached_data)
             return cached_data
 
     # Query API
@@ -85,6 +94,7 @@ def list_census_datasets(
             )
 
         # Cache the result
+        session_cache_set(cache_key, df)
         if use_cache:
             cache_data(cache_key, df)
 
@@ -183,7 +193,7 @@ def dataset_attribution(datasets):
 
     for attr in attributions:
         # Replace 4-digit years with placeholder to create pattern
-        pattern = re.sub(r"\d{4}", "{{YEAR}}", attr)
+        pattern = _YEAR_RE.sub("{{YEAR}}", attr)
 
         if pattern not in pattern_map:
             pattern_map[pattern] = []
@@ -200,7 +210,7 @@ def dataset_attribution(datasets):
             # Extract all years from the attributions
             all_years = []
             for attr in attr_list:
-                years = re.findall(r"\d{4}", attr)
+                years = _YEAR_RE.findall(attr)
                 all_years.extend(years)
 
             # Remove duplicates and sort
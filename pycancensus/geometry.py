@@ -2,11 +2,13 @@
 Functions for working with census geometry.
 """
 
-import geopandas as gpd
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from .core import get_census
 
+if TYPE_CHECKING:
+    import geopandas as gpd
+
 
 def get_census_geometry(
     dataset: str,
@@ -16,7 +18,7 @@ def get_census_geometry(
     use_cache: bool = True,
     quiet: bool = False,
     api_key: Optional[str] = None,
-) -> gpd.GeoDataFrame:
+) -> "gpd.GeoDataFrame":
     """
     Get census boundary geometries from the CensusMapper API.
 
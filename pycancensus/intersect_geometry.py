@@ -5,23 +5,27 @@ Functions for finding census regions that intersect with geometries.
 import hashlib
 import json
 import warnings
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-import geopandas as gpd
 import requests
-from shapely.geometry import MultiPolygon, Point, Polygon
-from shapely.ops import unary_union
 
 from .settings import get_api_key, CENSUSMAPPER_API_URL
 from .resilience import get_session
 from .cache import get_cached_data, cache_data
 from .utils import validate_dataset
 
+if TYPE_CHECKING:
+    # geopandas and shapely are imported lazily when a geometry is processed
+    import geopandas as gpd
+    from shapely.geometry import MultiPolygon, Point, Polygon
+
 
 def get_intersecting_geometries(
     dataset: str,
     level: str,
-    geometry: Union[gpd.GeoDataFrame, gpd.GeoSeries, Point, Polygon, MultiPolygon],
+    geometry: Union[
+        "gpd.GeoDataFrame", "gpd.GeoSeries", "Point", "Polygon", "MultiPolygon"
+    ],
     simplified: bool = False,
     use_cache: bool = True,
     quiet: bool = False,
@@ -107,6 +111,9 @@ def get_intersecting_geometries(
 
     # Union multiple geometries if needed
     if len(processed_geometry) > 1:
+        import geopandas as gpd
+        from shapely.ops import unary_union
+
         geometry_union = unary_union(processed_geometry.geometry)
         processed_geometry = gpd.GeoSeries([geometry_union], crs="EPSG:4326")
 
@@ -158,8 +165,10 @@ def get_intersecting_geometries(
             return {level: []}
 
 
-def _process_geometry_input(geometry) -> gpd.GeoSeries:
+def _process_geometry_input(geometry) -> "gpd.GeoSeries":
     """Process various geometry input types into a GeoSeries."""
+    import geopandas as gpd
+
     if isinstance(geometry, gpd.GeoDataFrame):
         return geometry.geometry
     elif isinstance(geometry, gpd.GeoSeries):
@@ -217,7 +217,7 @@ def as_census_region_list(tbl: pd.DataFrame) -> dict:
         )
     return {
         level: group["region"].astype(str).tolist()
-        for level, group in tbl.groupby("level", sort=False)
+        for level, group in tbl.groupby("level", sort=False, observed=True)
     }
 
 
@@ -248,12 +248,12 @@ def add_unique_names_to_region_list(region_list: pd.DataFrame) -> pd.DataFrame:
             f"{sorted(required)} as returned by list_census_regions()."
         )
     result = region_list.copy()
-    counts = result.groupby("name")["name"].transform("size")
+    counts = result.groupby("name", observed=True)["name"].transform("size")
     result["Name"] = result["name"].where(
         counts == 1,
         result["name"] + " (" + result["municipal_status"].astype(str) + ")",
     )
-    counts = result.groupby("Name")["Name"].transform("size")
+    counts = result.groupby("Name", observed=True)["Name"].transform("size")
     result["Name"] = result["Name"].where(
         counts == 1,
         result["Name"] + " (" + result["region"].astype(str) + ")",
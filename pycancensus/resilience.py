@@ -3,6 +3,7 @@
 import atexit
 import logging
 import random
+import threading
 import time
 from functools import wraps
 from typing import Any, Callable, Dict, Optional
@@ -176,20 +177,27 @@ class ResilientSession:
         self.retry_on_status = retry_on_status
         self.respect_retry_after = respect_retry_after
 
-        # Rate limiting state
+        # Rate limiting state, shared by every thread using this session
         self._last_request_time = 0
         self._min_request_interval = 0.1  # Minimum 100ms between requests
+        self._rate_limit_lock = threading.Lock()
 
     def _enforce_rate_limit(self):
-        """Enforce minimum interval between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
+        """Enforce minimum interval between requests.
 
-        if time_since_last < self._min_request_interval:
-            sleep_time = self._min_request_interval - time_since_last
-            time.sleep(sleep_time)
+        Each caller reserves the next free slot under a lock and then sleeps
+        outside it, so concurrent threads are spaced out rather than all
+        passing the check at once.
+        """
+        with self._rate_limit_lock:
+            current_time = time.time()
+            sleep_time = (
+                self._last_request_time + self._min_request_interval - current_time
+            )
+            self._last_request_time = current_time + max(sleep_time, 0)
 
-        self._last_request_time = time.time()
+        if sleep_time > 0:
+            time.sleep(sleep_time)
 
     def _is_retryable_status(self, status_code: int) -> bool:
         """Check if a status code represents a transient, retryable error."""
@@ -331,25 +339,44 @@ class ResilientSession:
 
 # Global session instance for use throughout pycancensus
 _global_session = None
+_global_session_lock = threading.Lock()
 
 
 def get_session() -> ResilientSession:
-    """Get or create the global resilient session."""
+    """Get or create the global resilient session.
+
+    Safe to call from several threads: they all share one session and its
+    connection pool.
+    """
     global _global_session
 
     if _global_session is None:
-        _global_session = ResilientSession()
+        with _global_session_lock:
+            if _global_session is None:
+                _global_session = ResilientSession()
 
     return _global_session
 
 
 def close_session():
-    """Close the global session."""
+    """
+    Close the shared HTTP session and release its pooled connections.
+
+    Every API call reuses one keep-alive session, so connections stay open
+    between calls. The session is closed automatically at interpreter exit;
+    call this to release it earlier. The next API call opens a new one.
+
+    Examples
+    --------
+    >>> import pycancensus as pc
+    >>> pc.close_session()
+    """
     global _global_session
 
-    if _global_session is not None:
-        _global_session.close()
-        _global_session = None
+    with _global_session_lock:
+        if _global_session is not None:
+            _global_session.close()
+            _global_session = None
 
 
 # Cleanup on module exit
@@ -2,11 +2,16 @@
 User settings and configuration for pycancensus.
 """
 
+import functools
 import os
 import json
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is the fallback
+    orjson = None
 
 # Global variables to store settings
 _API_KEY = None
@@ -17,12 +22,12 @@ CENSUSMAPPER_API_URL = "https://censusmapper.ca/api/v1"
 CENSUSMAPPER_DATA_URL = "https://censusmapper.ca/data_sets"
 
 
-# Config file location
+# Config file location. Resolved once per process; call
+# _get_config_path.cache_clear() after changing HOME.
+@functools.lru_cache(maxsize=None)
 def _get_config_path() -> Path:
     """Get the path to the config file."""
-    config_dir = Path.home() / ".pycancensus"
-    config_dir.mkdir(exist_ok=True, mode=0o700)  # Secure permissions
-    return config_dir / "config.json"
+    return Path.home() / ".pycancensus" / "config.json"
 
 
 def _load_config() -> Dict[str, Any]:
@@ -30,9 +35,10 @@ def _load_config() -> Dict[str, Any]:
     config_path = _get_config_path()
     if config_path.exists():
         try:
-            with open(config_path, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            with open(config_path, "rb") as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (ValueError, IOError):  # both decoders raise ValueError subclasses
             return {}
     return {}
 
@@ -40,9 +46,15 @@ def _load_config() -> Dict[str, Any]:
 def _save_config(config: Dict[str, Any]) -> None:
     """Save configuration to file."""
     config_path = _get_config_path()
+    if orjson is not None:
+        payload = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(config, indent=2).encode("utf-8")
     try:
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
+        # Only writing needs the directory; reads just check for the file
+        config_path.parent.mkdir(exist_ok=True, mode=0o700)  # Secure permissions
+        with open(config_path, "wb") as f:
+            f.write(payload)
         # Set secure file permissions (read/write for owner only)
         config_path.chmod(0o600)
     except IOError as e:
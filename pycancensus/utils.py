@@ -4,6 +4,10 @@ Utility functions for pycancensus.
 
 from typing import Dict, List, Union
 
+# Census aggregation levels, in display order for error messages
+_VALID_LEVELS = ("C", "Regions", "PR", "CMA", "CD", "CSD", "CT", "DA", "EA", "DB")
+_VALID_REGION_LEVELS = ("C", "PR", "CMA", "CD", "CSD", "CT", "DA", "EA", "DB")
+
 
 def validate_dataset(dataset: str) -> str:
     """
@@ -58,11 +62,9 @@ def validate_level(level: str) -> str:
     ValueError
         If level is invalid.
     """
-    valid_levels = ["C", "Regions", "PR", "CMA", "CD", "CSD", "CT", "DA", "EA", "DB"]
-
-    if level not in valid_levels:
+    if level not in _VALID_LEVELS:
         raise ValueError(
-            f"Invalid level: {level}. " f"Valid levels are: {', '.join(valid_levels)}"
+            f"Invalid level: {level}. " f"Valid levels are: {', '.join(_VALID_LEVELS)}"
         )
 
     return level
@@ -95,14 +97,12 @@ def process_regions(
     if not regions:
         raise ValueError("At least one region must be specified")
 
-    valid_region_levels = ["C", "PR", "CMA", "CD", "CSD", "CT", "DA", "EA", "DB"]
-
     processed = {}
     for level, ids in regions.items():
-        if level not in valid_region_levels:
+        if level not in _VALID_REGION_LEVELS:
             raise ValueError(
                 f"Invalid region level: {level}. "
-                f"Valid levels are: {', '.join(valid_region_levels)}"
+                f"Valid levels are: {', '.join(_VALID_REGION_LEVELS)}"
             )
 
         # Ensure IDs are strings
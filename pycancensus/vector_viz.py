@@ -151,7 +151,8 @@ def _print_children(
     if n_children == 0:
         return
 
-    for i, (_, child) in enumerate(direct_children.iterrows()):
+    # Plain dicts, not iterrows(): that builds a Series for every row
+    for i, child in enumerate(direct_children.to_dict("records")):
         is_last = i == n_children - 1
         connector = "└── " if is_last else "├── "
         child_prefix = "    " if is_last else "│   "
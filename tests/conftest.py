@@ -0,0 +1,61 @@
+"""Shared pytest fixtures for the pycancensus test suite."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+import pycancensus.cache as cache_mod
+
+# Canned API response bodies shared by the mocked tests
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def pytest_collection_modifyitems(config, items):
+    """Pin ``serial`` tests to a single xdist worker.
+
+    Tests that drive the R bridge share one R installation and its package
+    cache, so under ``-n auto --dist=loadgroup`` they all land in the
+    ``r_bridge`` group and run one after another. Without pytest-xdist the
+    marker would be unknown, and the tests run serially anyway.
+    """
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group(name="r_bridge"))
+
+
+@pytest.fixture(scope="session")
+def cache_dir(tmp_path_factory):
+    """One temporary directory for the whole session.
+
+    Tests that need isolation create their own subdirectory under it.
+    """
+    return tmp_path_factory.mktemp("pycc_cache")
+
+
+@pytest.fixture(scope="session")
+def datasets_json():
+    """Canned /list_datasets response body, parsed."""
+    return json.loads((FIXTURES_DIR / "datasets.json").read_text())
+
+
+@pytest.fixture(scope="session")
+def regions_csv():
+    """Canned place_names.csv response body."""
+    return (FIXTURES_DIR / "regions.csv").read_text()
+
+
+@pytest.fixture(scope="session")
+def vectors_csv():
+    """Canned vector_info CSV response body."""
+    return (FIXTURES_DIR / "vectors.csv").read_text()
+
+
+@pytest.fixture(autouse=True)
+def clean_session_cache():
+    """Keep list results cached in memory by one test out of the next."""
+    cache_mod._session_cache.clear()
+    yield
+    cache_mod._session_cache.clear()
@@ -1,12 +1,20 @@
-"""Integration tests for pycancensus compatibility with cancensus R library."""
+"""Integration tests for pycancensus compatibility with cancensus R library.
 
+These tests are network-bound and independent, so they parallelize well:
+
+    pytest -n auto --dist=loadscope tests/integration/
+"""
+
+import hashlib
 import os
+import re
 import pytest
 import pandas as pd
 import numpy as np
 from unittest.mock import patch, MagicMock
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 import sys
 from pathlib import Path
@@ -16,29 +24,44 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 import pycancensus as pc
 
+# String forms of census NA markers that should never survive processing
+_NA_PATTERN = re.compile(r"^(?:x|X|F|\.\.\.)$")
 
-class TestCancensusCompatibility:
-    """Test pycancensus compatibility with cancensus R library results."""
 
-    @pytest.fixture(autouse=True)
-    def setup_test_env(self):
-        """Setup test environment."""
-        # Use test API key or skip if not available
-        test_api_key = os.environ.get("CANCENSUS_API_KEY")
-        if test_api_key:
-            pc.set_api_key(test_api_key)
-        else:
-            pytest.skip("CANCENSUS_API_KEY not set")
+def _frame_digest(df):
+    """Hash a DataFrame's values and index in one vectorized pass."""
+    hashed = pd.util.hash_pandas_object(df, index=True)
+    return hashlib.sha1(hashed.values.tobytes()).digest()
+
+
+@pytest.fixture(scope="class")
+def class_api_key():
+    """Set the API key once for the whole class."""
+    test_api_key = os.environ.get("CANCENSUS_API_KEY")
+    if test_api_key:
+        pc.set_api_key(test_api_key)
+    else:
+        pytest.skip("CANCENSUS_API_KEY not set")
+
+
+@pytest.fixture(scope="class")
+def class_cache_dir(request, class_api_key):
+    """Point the cache at one temporary directory for the whole class."""
+    # One directory per xdist worker so parallel classes never collide
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    request.cls.temp_cache = tempfile.mkdtemp(prefix=f"pycancensus_{worker}_")
+    pc.set_cache_path(request.cls.temp_cache)
+
+    yield
 
-        # Setup temporary cache directory
-        self.temp_cache = tempfile.mkdtemp()
-        pc.set_cache_path(self.temp_cache)
+    # Cleanup
+    if os.path.exists(request.cls.temp_cache):
+        shutil.rmtree(request.cls.temp_cache)
 
-        yield
 
-        # Cleanup
-        if os.path.exists(self.temp_cache):
-            shutil.rmtree(self.temp_cache)
+@pytest.mark.usefixtures("class_cache_dir")
+class TestCancensusCompatibility:
+    """Test pycancensus compatibility with cancensus R library results."""
 
     def test_get_census_basic_functionality(self):
         """Test basic get_census functionality matches expected patterns."""
@@ -171,8 +194,12 @@ class TestCancensusCompatibility:
             dataset="CA21", regions={"PR": "59"}, vectors=["v_CA21_1"], level="PR"
         )
 
-        # Data should be identical
-        pd.testing.assert_frame_equal(data1, data2)
+        # Data should be identical; the cell-by-cell comparison only runs
+        # to report what differs when the content hashes disagree
+        assert list(data1.columns) == list(data2.columns)
+        assert data1.dtypes.equals(data2.dtypes)
+        if _frame_digest(data1) != _frame_digest(data2):
+            pd.testing.assert_frame_equal(data1, data2)
 
     def test_data_type_consistency(self):
         """Test that data types are consistent with cancensus expectations."""
@@ -193,11 +220,12 @@ class TestCancensusCompatibility:
 
         # Check for proper handling of NA values
         # Should not have string representations of NA
-        for col in data.columns:
-            if data[col].dtype == "object" or pd.api.types.is_string_dtype(data[col]):
-                assert not any(
-                    data[col].astype(str).str.contains(r"^(x|X|F|\.\.\.)$", na=False)
-                )
+        text_cols = data.select_dtypes(include=["object", "string"])
+        for col in text_cols.columns:
+            values = text_cols[col]
+            if not isinstance(values.dtype, pd.StringDtype):
+                values = values.astype("string")
+            assert not values.str.contains(_NA_PATTERN, na=False).any()
 
     def test_multiple_regions_functionality(self):
         """Test handling of multiple regions."""
@@ -209,8 +237,7 @@ class TestCancensusCompatibility:
         )
 
         assert len(data) == 2  # Should have data for both cities
-        assert "5915022" in data["GeoUID"].values
-        assert "3520005" in data["GeoUID"].values
+        assert data["GeoUID"].isin({"5915022", "3520005"}).sum() == 2
 
     def test_hierarchical_region_retrieval(self):
         """Test retrieving data at different hierarchical levels."""
@@ -224,7 +251,7 @@ class TestCancensusCompatibility:
 
         # Should have multiple census tracts
         assert len(data) > 100  # Vancouver CMA has many CTs
-        assert all(data["GeoUID"].str.len() == 10)  # CT GeoUIDs are 10 digits
+        assert (data["GeoUID"].str.len() == 10).all()  # CT GeoUIDs are 10 digits
 
     @pytest.mark.slow
     def test_large_dataset_handling(self):
@@ -243,18 +270,11 @@ class TestCancensusCompatibility:
         assert data["v_CA21_1"].sum() > 0  # Total population should be positive
 
 
+@pytest.mark.usefixtures("class_api_key")
 class TestDataQuality:
     """Test data quality and consistency."""
 
-    @pytest.fixture(autouse=True)
-    def setup_test_env(self):
-        """Setup test environment."""
-        test_api_key = os.environ.get("CANCENSUS_API_KEY")
-        if test_api_key:
-            pc.set_api_key(test_api_key)
-        else:
-            pytest.skip("CANCENSUS_API_KEY not set")
-
+    @pytest.mark.slow
     def test_data_consistency_across_levels(self):
         """Test that data is consistent across geographic levels."""
         # Get CMA-level data
@@ -289,22 +309,31 @@ class TestDataQuality:
             ("CT", "CA21", 10),  # CT: 10 digits
         ]
 
+        # The requests are independent, so overlap their network waits
+        with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+            futures = {
+                level: executor.submit(
+                    pc.get_census,
+                    dataset=dataset,
+                    regions={"PR": "59"},  # BC
+                    vectors=["v_CA21_1"],
+                    level=level,
+                    quiet=True,
+                )
+                for level, dataset, _ in test_cases
+            }
+
         for level, dataset, expected_length in test_cases:
-            data = pc.get_census(
-                dataset=dataset,
-                regions={"PR": "59"},  # BC
-                vectors=["v_CA21_1"],
-                level=level,
-            )
+            data = futures[level].result()
 
             # Check GeoUID format
-            assert all(
+            assert (
                 data["GeoUID"].str.len() == expected_length
-            ), f"GeoUID length mismatch for {level}: expected {expected_length}"
+            ).all(), f"GeoUID length mismatch for {level}: expected {expected_length}"
 
             # Check GeoUID is numeric
-            assert all(
-                data["GeoUID"].str.isdigit()
+            assert (
+                data["GeoUID"].str.isdigit().all()
             ), f"Non-numeric GeoUID found for {level}"
 
 
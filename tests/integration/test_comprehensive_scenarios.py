@@ -16,9 +16,11 @@ import sys
 import pytest
 import pandas as pd
 import numpy as np
+import shapely
 from pathlib import Path
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 # Add pycancensus to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -62,16 +64,19 @@ class TestComprehensiveScenarios:
         assert "v_CA21_1" in data.columns or any(
             "Population" in col for col in data.columns
         ), "Population data missing"
+
+        # One aggregation call for the total and both extremes
+        population = data["Population"].agg(["sum", "idxmax", "idxmin"])
         assert (
-            data["Population"].sum() > 10000000
+            population["sum"] > 10000000
         ), "Total population seems too low for selected provinces"
 
         print(f"   ✅ Retrieved data for {len(data)} provinces/territories")
-        print(f"   ✅ Total population: {data['Population'].sum():,}")
+        print(f"   ✅ Total population: {population['sum']:,}")
 
         # Find most/least populous provinces
-        max_pop = data.loc[data["Population"].idxmax()]
-        min_pop = data.loc[data["Population"].idxmin()]
+        max_pop = data.loc[population["idxmax"]]
+        min_pop = data.loc[population["idxmin"]]
         print(
             f"   📈 Most populous: {max_pop['Region Name']} ({max_pop['Population']:,})"
         )
@@ -106,9 +111,10 @@ class TestComprehensiveScenarios:
         assert (
             len(data) > 20
         ), f"Expected many municipalities in Toronto CMA, got {len(data)}"
-        assert any(
-            "Population" in col for col in data.columns
-        ), "Population data missing"
+        cols = data.columns
+        assert cols.str.contains(
+            "Population", regex=False
+        ).any(), "Population data missing"
 
         total_pop = data["Population"].sum()
         print(f"   ✅ Retrieved data for {len(data)} municipalities")
@@ -120,8 +126,10 @@ class TestComprehensiveScenarios:
             female_col = "v_CA21_3"
         else:
             # Find columns by pattern
-            male_col = next((col for col in data.columns if "Male" in col), None)
-            female_col = next((col for col in data.columns if "Female" in col), None)
+            male_mask = cols.str.contains("Male", regex=False)
+            female_mask = cols.str.contains("Female", regex=False)
+            male_col = cols[male_mask][0] if male_mask.any() else None
+            female_col = cols[female_mask][0] if female_mask.any() else None
 
         if male_col and female_col:
             total_male = data[male_col].sum()
@@ -183,8 +191,10 @@ class TestComprehensiveScenarios:
         if income_col and not data[income_col].isna().all():
             data_sorted = data.sort_values(income_col, ascending=False)
             print("   📈 Income ranking:")
-            for idx, row in data_sorted.head(3).iterrows():
-                print(f"      {row['Region Name']}: ${row[income_col]:,.0f}")
+            # Plain tuples: the column names aren't valid namedtuple fields
+            top = data_sorted.head(3)[["Region Name", income_col]]
+            for region_name, income in top.itertuples(index=False, name=None):
+                print(f"      {region_name}: ${income:,.0f}")
 
     def test_scenario_4_vector_hierarchy_navigation(self):
         """
@@ -232,23 +242,30 @@ class TestComprehensiveScenarios:
         test_region = {"CSD": "5915022"}  # Vancouver
 
         try:
-            # Get 2021 data
-            data_2021 = pc.get_census(
-                dataset="CA21",
-                regions=test_region,
-                vectors=["v_CA21_1"],  # Total population
-                level="CSD",
-                quiet=True,
-            )
+            # The API cannot batch across datasets, so overlap the two requests
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Get 2021 data
+                future_2021 = executor.submit(
+                    pc.get_census,
+                    dataset="CA21",
+                    regions=test_region,
+                    vectors=["v_CA21_1"],  # Total population
+                    level="CSD",
+                    quiet=True,
+                )
 
-            # Get 2016 data
-            data_2016 = pc.get_census(
-                dataset="CA16",
-                regions=test_region,
-                vectors=["v_CA16_401"],  # Total population in 2016
-                level="CSD",
-                quiet=True,
-            )
+                # Get 2016 data
+                future_2016 = executor.submit(
+                    pc.get_census,
+                    dataset="CA16",
+                    regions=test_region,
+                    vectors=["v_CA16_401"],  # Total population in 2016
+                    level="CSD",
+                    quiet=True,
+                )
+
+                data_2021 = future_2021.result()
+                data_2016 = future_2016.result()
 
             if len(data_2021) > 0 and len(data_2016) > 0:
                 pop_2021 = (
@@ -313,7 +330,7 @@ class TestComprehensiveScenarios:
             print(f"   📏 Has geometry: {hasattr(geo_data, 'geometry')}")
 
             # Check spatial validity
-            valid_geometries = geo_data.geometry.is_valid.sum()
+            valid_geometries = int(shapely.is_valid(geo_data.geometry.to_numpy()).sum())
             print(f"   ✅ Valid geometries: {valid_geometries}/{len(geo_data)}")
 
         except Exception as e:
@@ -409,34 +426,28 @@ def run_performance_benchmark():
 
 
 if __name__ == "__main__":
-    # Set up API key
-    pc.set_api_key(API_KEY)
-
     print("🚀 Running Comprehensive Integration Tests")
     print("=" * 60)
 
-    # Run test scenarios
-    test_class = TestComprehensiveScenarios()
-
+    # Scenarios are independent and network-bound, so spread them across
+    # workers when pytest-xdist is installed
+    args = [__file__, "-v", "-s"]
     try:
-        test_class.test_scenario_1_provincial_population_analysis()
-        test_class.test_scenario_2_toronto_demographic_breakdown()
-        test_class.test_scenario_3_income_inequality_analysis()
-        test_class.test_scenario_4_vector_hierarchy_navigation()
-        test_class.test_scenario_5_multi_dataset_comparison()
-        test_class.test_scenario_6_geography_with_data()
-
-        # Run robustness tests
-        robustness_class = TestRobustnessAndEdgeCases()
-        robustness_class.test_large_region_request()
-
-        # Run performance benchmark
-        run_performance_benchmark()
-
-        print("\n" + "=" * 60)
-        print("✅ COMPREHENSIVE TESTS COMPLETED SUCCESSFULLY")
-        print("   All real-world scenarios validated!")
-
-    except Exception as e:
-        print(f"\n❌ TEST FAILURE: {e}")
-        raise
+        import xdist  # noqa: F401
+
+        args += ["-n", "auto", "--dist=load"]
+    except ImportError:
+        pass
+
+    exit_code = pytest.main(args)
+    if exit_code != 0:
+        print(f"\n❌ TEST FAILURE: pytest exited with {exit_code}")
+        sys.exit(exit_code)
+
+    # Run performance benchmark
+    pc.set_api_key(API_KEY)
+    run_performance_benchmark()
+
+    print("\n" + "=" * 60)
+    print("✅ COMPREHENSIVE TESTS COMPLETED SUCCESSFULLY")
+    print("   All real-world scenarios validated!")
@@ -0,0 +1,11 @@
+"""Pytest fixtures for the performance benchmarks."""
+
+import logging
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def profiler_logs(caplog):
+    """Capture PerformanceProfiler's INFO measurements, not only warnings."""
+    caplog.set_level(logging.INFO)
@@ -7,15 +7,23 @@ Tests the library's performance and reliability when handling:
 - Many variables simultaneously
 - Geographic data with complex geometries
 - Memory efficiency and response times
+
+Profiler measurements are logged at INFO level. conftest.py captures them,
+so pytest reports them with each failing test (and passing ones with
+``-rP``); stream them live with ``--log-cli-level=INFO``.
 """
 
+import hashlib
+import logging
 import os
 import sys
 import time
 import gc
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pandas as pd
-import pytest
+import shapely
 
 # Optional dependency for performance monitoring
 try:
@@ -29,6 +37,8 @@ except ImportError:
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 import pycancensus as pc
 
+logger = logging.getLogger(__name__)
+
 # Test configuration
 API_KEY = (
     os.environ.get("CANCENSUS_API_KEY")
@@ -37,35 +47,86 @@ API_KEY = (
 
 
 class PerformanceProfiler:
-    """Profile memory and time performance of operations."""
+    """Profile memory and time performance of operations.
+
+    Memory is measured with tracemalloc, which counts only Python
+    allocations made inside the block. Process RSS from psutil, when
+    installed, is reported as a secondary figure.
+    """
 
     def __init__(self, operation_name: str):
         self.operation_name = operation_name
         self.start_time = None
         self.start_memory = None
-        self.peak_memory = None
+        self.start_traced = None
+        self._started_tracing = False
 
     def __enter__(self):
         gc.collect()  # Clean up before measuring
-        self.start_time = time.time()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        elif hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+            tracemalloc.reset_peak()
+        self.start_traced = tracemalloc.get_traced_memory()[0]
         if HAS_PSUTIL:
             self.start_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
+        self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        end_time = time.time()
-        elapsed_time = end_time - self.start_time
-
-        print(f"⚡ {self.operation_name}:")
-        print(f"   ⏱️  Time: {elapsed_time:.2f}s")
+        elapsed_time = time.perf_counter() - self.start_time
+        current, peak = tracemalloc.get_traced_memory()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        logger.info(
+            "%s: time=%.2fs mem=%+.1fMB peak=%.1fMB",
+            self.operation_name,
+            elapsed_time,
+            (current - self.start_traced) / 1024**2,
+            (peak - self.start_traced) / 1024**2,
+        )
 
         if HAS_PSUTIL:
             end_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
-            memory_used = end_memory - self.start_memory
-            print(f"   💾 Memory: {memory_used:+.1f} MB")
-            print(f"   📊 Peak Memory: {end_memory:.1f} MB")
-        else:
-            print(f"   💾 Memory: (psutil not available)")
+            logger.info(
+                "%s: rss=%.1fMB (%+.1fMB)",
+                self.operation_name,
+                end_memory,
+                end_memory - self.start_memory,
+            )
+
+    @staticmethod
+    def profile_all(operation_name, tasks, max_workers=4):
+        """Run independent ``(label, func)`` tasks concurrently under one profile.
+
+        The calls are network-bound, so wall-clock time drops from the sum of
+        the latencies to roughly the slowest one. tracemalloc is process-wide,
+        so memory is reported for the whole batch; each task is still timed
+        inside its own worker. Returns ``(label, result, error,
+        elapsed_seconds)`` tuples in task order.
+        """
+        with PerformanceProfiler(operation_name):
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(lambda task: _timed_call(task[1]), tasks))
+        return [(label, *outcome) for (label, _), outcome in zip(tasks, outcomes)]
+
+
+def _frame_digest(df):
+    """Hash a DataFrame's values and index in one vectorized pass."""
+    hashed = pd.util.hash_pandas_object(df, index=True)
+    return hashlib.sha256(hashed.values.tobytes()).digest()
+
+
+def _timed_call(func):
+    """Call ``func`` and return ``(result, error, elapsed_seconds)``."""
+    start = time.perf_counter()
+    try:
+        return func(), None, time.perf_counter() - start
+    except Exception as e:
+        return None, e, time.perf_counter() - start
 
 
 def test_large_vector_counts():
@@ -79,25 +140,33 @@ def test_large_vector_counts():
     # Test with increasing numbers of vectors
     test_sizes = [10, 50, 100, 200]
 
+    tasks = []
     for size in test_sizes:
         if size > len(all_vectors):
             print(f"   ⚠️  Skipping {size} vectors (only {len(all_vectors)} available)")
             continue
 
-        vectors = all_vectors["vector"].head(size).tolist()
-
-        with PerformanceProfiler(f"Retrieving {size} vectors for Ontario"):
-            try:
-                data = pc.get_census(
+        vectors = all_vectors["vector"].to_numpy()[:size]
+        tasks.append(
+            (
+                f"Retrieving {size} vectors for Ontario",
+                lambda vectors=vectors: pc.get_census(
                     dataset="CA21",
                     regions={"PR": "35"},  # Ontario
                     vectors=vectors,
                     level="PR",
                     quiet=True,
-                )
-                print(f"   ✅ Success: {len(data)} rows × {len(data.columns)} columns")
-            except Exception as e:
-                print(f"   ❌ Failed: {e}")
+                ),
+            )
+        )
+
+    outcomes = PerformanceProfiler.profile_all(f"{len(tasks)} vector sweeps", tasks)
+    for label, data, error, elapsed in outcomes:
+        print(f"   {label}: {elapsed:.2f}s")
+        if error is None:
+            print(f"   ✅ Success: {len(data)} rows × {len(data.columns)} columns")
+        else:
+            print(f"   ❌ Failed: {error}")
 
 
 def test_large_region_counts():
@@ -150,19 +219,27 @@ def test_large_region_counts():
         ("Quebec CSDs", {"PR": "24"}, "CSD"),
     ]
 
-    for name, regions, level in test_cases:
-        with PerformanceProfiler(f"{name} at {level} level"):
-            try:
-                data = pc.get_census(
-                    dataset="CA21",
-                    regions=regions,
-                    vectors=["v_CA21_1"],  # Just population
-                    level=level,
-                    quiet=True,
-                )
-                print(f"   ✅ Success: {len(data)} regions retrieved")
-            except Exception as e:
-                print(f"   ❌ Failed: {e}")
+    tasks = [
+        (
+            f"{name} at {level} level",
+            lambda regions=regions, level=level: pc.get_census(
+                dataset="CA21",
+                regions=regions,
+                vectors=["v_CA21_1"],  # Just population
+                level=level,
+                quiet=True,
+            ),
+        )
+        for name, regions, level in test_cases
+    ]
+
+    outcomes = PerformanceProfiler.profile_all(f"{len(tasks)} region requests", tasks)
+    for label, data, error, elapsed in outcomes:
+        print(f"   {label}: {elapsed:.2f}s")
+        if error is None:
+            print(f"   ✅ Success: {len(data)} regions retrieved")
+        else:
+            print(f"   ❌ Failed: {error}")
 
 
 def test_geographic_data_performance():
@@ -176,37 +253,55 @@ def test_geographic_data_performance():
         ("Large CMA (Toronto) CSDs", {"CMA": "35535"}, "CSD"),
     ]
 
-    for name, regions, level in test_cases:
-        with PerformanceProfiler(f"{name} with geography"):
-            try:
-                geo_data = pc.get_census(
-                    dataset="CA21",
-                    regions=regions,
-                    vectors=["v_CA21_1"],
-                    level=level,
-                    geo_format="geopandas",
-                    quiet=True,
-                )
-                print(f"   ✅ Success: {len(geo_data)} regions with geometry")
-                print(
-                    f"   📏 Geometry complexity: {geo_data.geometry.apply(lambda g: len(str(g))).mean():.0f} chars avg"
-                )
-            except Exception as e:
-                print(f"   ❌ Failed: {e}")
+    tasks = [
+        (
+            f"{name} with geography",
+            lambda regions=regions, level=level: pc.get_census(
+                dataset="CA21",
+                regions=regions,
+                vectors=["v_CA21_1"],
+                level=level,
+                geo_format="geopandas",
+                quiet=True,
+            ),
+        )
+        for name, regions, level in test_cases
+    ]
+
+    outcomes = PerformanceProfiler.profile_all(f"{len(tasks)} geometry requests", tasks)
+    for label, geo_data, error, elapsed in outcomes:
+        print(f"   {label}: {elapsed:.2f}s")
+        if error is None:
+            print(f"   ✅ Success: {len(geo_data)} regions with geometry")
+            coords = shapely.get_num_coordinates(geo_data.geometry.to_numpy())
+            print(f"   📏 Geometry complexity: {coords.mean():.0f} coords avg")
+        else:
+            print(f"   ❌ Failed: {error}")
 
 
-@pytest.mark.skipif(not HAS_PSUTIL, reason="psutil not installed")
 def test_memory_efficiency():
-    """Test memory usage patterns."""
+    """Test memory usage patterns.
+
+    tracemalloc counts only Python allocations, so buffers allocated natively
+    by pyarrow, pyogrio or GEOS are excluded from the traced figures. Process
+    RSS from psutil, when installed, is reported alongside to cover them.
+    """
     print("\n💾 Testing Memory Efficiency")
     print("-" * 40)
 
-    # Baseline memory
+    # Baseline memory, counting only Python allocations. Only stop tracing
+    # if this test started it, so an outer tracing session is left intact.
     gc.collect()
-    baseline_memory = psutil.Process().memory_info().rss / 1024 / 1024
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    elif hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+        tracemalloc.reset_peak()
+    baseline_memory = tracemalloc.get_traced_memory()[0] / 1024 / 1024
     print(f"📊 Baseline Memory: {baseline_memory:.1f} MB")
-
-    datasets = []
+    if HAS_PSUTIL:
+        baseline_rss = psutil.Process().memory_info().rss / 1024 / 1024
+        print(f"🧮 Baseline Process RSS: {baseline_rss:.1f} MB")
 
     # Load progressively larger datasets
     test_loads = [
@@ -216,37 +311,45 @@ def test_memory_efficiency():
         ("Geographic dataset", {"PR": "46"}, "CSD", "geopandas"),
     ]
 
-    for name, regions, level, geo_format in test_loads:
-        gc.collect()
-        pre_memory = psutil.Process().memory_info().rss / 1024 / 1024
+    try:
+        for name, regions, level, geo_format in test_loads:
+            gc.collect()
+            pre_memory = tracemalloc.get_traced_memory()[0] / 1024 / 1024
 
-        try:
-            data = pc.get_census(
-                dataset="CA21",
-                regions=regions,
-                vectors=["v_CA21_1", "v_CA21_2", "v_CA21_3"],
-                level=level,
-                geo_format=geo_format,
-                quiet=True,
-            )
-            datasets.append((name, data))
+            try:
+                data = pc.get_census(
+                    dataset="CA21",
+                    regions=regions,
+                    vectors=["v_CA21_1", "v_CA21_2", "v_CA21_3"],
+                    level=level,
+                    geo_format=geo_format,
+                    quiet=True,
+                )
+                post_memory = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+                memory_increase = post_memory - pre_memory
 
-            post_memory = psutil.Process().memory_info().rss / 1024 / 1024
-            memory_increase = post_memory - pre_memory
+                print(f"   {name}: +{memory_increase:.1f} MB ({len(data)} rows)")
 
-            print(f"   {name}: +{memory_increase:.1f} MB ({len(data)} rows)")
+                # Only the size is needed, so free each load before the next
+                del data
 
-        except Exception as e:
-            print(f"   {name}: Failed - {e}")
+            except Exception as e:
+                print(f"   {name}: Failed - {e}")
 
-    # Check total memory usage
-    final_memory = psutil.Process().memory_info().rss / 1024 / 1024
-    total_increase = final_memory - baseline_memory
-    print(f"📈 Total Memory Increase: {total_increase:.1f} MB")
+        # Check memory retained after all loads were released
+        gc.collect()
+        final_memory, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
 
-    # Clean up
-    del datasets
-    gc.collect()
+    total_increase = final_memory / 1024 / 1024 - baseline_memory
+    print(f"📈 Total Memory Increase: {total_increase:.1f} MB")
+    print(f"📊 Peak Memory: {peak_memory / 1024 / 1024:.1f} MB")
+    if HAS_PSUTIL:
+        # Includes native buffers that tracemalloc cannot see
+        final_rss = psutil.Process().memory_info().rss / 1024 / 1024
+        print(f"🧮 Process RSS Increase: {final_rss - baseline_rss:+.1f} MB")
 
 
 def test_caching_performance():
@@ -271,11 +374,14 @@ def test_caching_performance():
         data2 = pc.get_census(**test_params, quiet=True)
         print(f"   📊 Data: {len(data2)} rows")
 
-    # Verify data is identical
-    try:
-        pd.testing.assert_frame_equal(data1, data2)
+    # Verify data is identical: same layout, then one vectorized content hash
+    if (
+        list(data1.columns) == list(data2.columns)
+        and data1.dtypes.equals(data2.dtypes)
+        and _frame_digest(data1) == _frame_digest(data2)
+    ):
         print("   ✅ Cached data matches original")
-    except AssertionError:
+    else:
         print("   ⚠️  Cached data differs from original")
 
 
@@ -321,4 +427,5 @@ def run_performance_benchmark():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="   %(message)s")
     run_performance_benchmark()
@@ -3,6 +3,10 @@
 Basic tests for pycancensus.
 """
 
+import logging
+import sys
+import uuid
+
 import pytest
 import pandas as pd
 import geopandas as gpd
@@ -20,85 +24,83 @@ class TestSettings:
         pc.set_api_key(test_key)
         assert pc.get_api_key() == test_key
 
-    def test_set_get_cache_path(self):
+    def test_set_get_cache_path(self, cache_dir):
         """Test setting and getting cache path."""
-        import tempfile
         import os
         from pathlib import Path
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pc.set_cache_path(temp_dir)
-            # Resolve both paths to handle symlinks on macOS
-            expected_path = str(Path(temp_dir).resolve())
-            actual_path = str(Path(pc.get_cache_path()).resolve())
-            assert actual_path == expected_path
-            assert os.path.exists(temp_dir)
+        temp_dir = cache_dir / uuid.uuid4().hex
+        pc.set_cache_path(str(temp_dir))
+        # Resolve both paths to handle symlinks on macOS
+        expected_path = str(Path(temp_dir).resolve())
+        actual_path = str(Path(pc.get_cache_path()).resolve())
+        assert actual_path == expected_path
+        assert os.path.exists(temp_dir)
 
-    def test_persistent_api_key_storage(self):
+    def test_persistent_api_key_storage(self, cache_dir):
         """Test persistent API key storage."""
-        import tempfile
         import json
-        from pathlib import Path
         from unittest.mock import patch
 
         test_key = "test_persistent_key_456"
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Mock the config directory to use temp directory
-            with patch("pycancensus.settings._get_config_path") as mock_config_path:
-                config_file = Path(temp_dir) / "config.json"
-                mock_config_path.return_value = config_file
+        temp_dir = cache_dir / uuid.uuid4().hex
+        temp_dir.mkdir()
+        # Mock the config directory to use temp directory
+        with patch("pycancensus.settings._get_config_path") as mock_config_path:
+            config_file = temp_dir / "config.json"
+            mock_config_path.return_value = config_file
 
-                # Clear any existing session variables
-                import pycancensus.settings as settings
+            # Clear any existing session variables
+            import pycancensus.settings as settings
 
-                settings._API_KEY = None
+            settings._API_KEY = None
 
-                # Set API key with persistence
-                pc.set_api_key(test_key, install=True)
+            # Set API key with persistence
+            pc.set_api_key(test_key, install=True)
 
-                # Verify config file was created
-                assert config_file.exists()
+            # Verify config file was created
+            assert config_file.exists()
 
-                # Verify config file contains the key
-                with open(config_file, "r") as f:
-                    config = json.load(f)
-                    assert config["api_key"] == test_key
+            # Verify config file contains the key
+            with open(config_file, "r") as f:
+                config = json.load(f)
+                assert config["api_key"] == test_key
 
-                # Clear session variable and test that key is still retrieved
-                settings._API_KEY = None
-                retrieved_key = pc.get_api_key()
-                assert retrieved_key == test_key
+            # Clear session variable and test that key is still retrieved
+            settings._API_KEY = None
+            retrieved_key = pc.get_api_key()
+            assert retrieved_key == test_key
 
-                # Test removal
-                pc.remove_api_key()
-                assert pc.get_api_key() is None
+            # Test removal
+            pc.remove_api_key()
+            assert pc.get_api_key() is None
 
-                # Verify config file was updated
-                with open(config_file, "r") as f:
-                    config = json.load(f)
-                    assert "api_key" not in config
+            # Verify config file was updated
+            with open(config_file, "r") as f:
+                config = json.load(f)
+                assert "api_key" not in config
 
 
 class TestUtils:
     """Test utility functions."""
 
-    def test_validate_dataset(self):
+    @pytest.mark.parametrize(
+        "dataset,expected", [("CA16", "CA16"), ("ca21", "CA21"), (" CA11 ", "CA11")]
+    )
+    def test_validate_dataset(self, dataset, expected):
         """Test dataset validation."""
         from pycancensus.utils import validate_dataset
 
-        # Valid datasets
-        assert validate_dataset("CA16") == "CA16"
-        assert validate_dataset("ca21") == "CA21"
-        assert validate_dataset(" CA11 ") == "CA11"
+        assert validate_dataset(dataset) == expected
+
+    @pytest.mark.parametrize("dataset", ["invalid", "CA", 123])
+    def test_validate_dataset_invalid(self, dataset):
+        """Test invalid datasets are rejected."""
+        from pycancensus.utils import validate_dataset
 
-        # Invalid datasets
-        with pytest.raises(ValueError):
-            validate_dataset("invalid")
-        with pytest.raises(ValueError):
-            validate_dataset("CA")
         with pytest.raises(ValueError):
-            validate_dataset(123)
+            validate_dataset(dataset)
 
     def test_validate_level(self):
         """Test level validation."""
@@ -130,26 +132,43 @@ class TestUtils:
             process_regions({"invalid": "123"})
 
 
+def _canned_session(**response_attrs):
+    """Build a mock session whose ``get`` returns a canned response."""
+    mock_response = MagicMock()
+    mock_response.configure_mock(**response_attrs)
+    mock_session = MagicMock()
+    mock_session.get.return_value = mock_response
+    return mock_session
+
+
+@pytest.fixture(scope="module")
+def canned_sessions(datasets_json, regions_csv, vectors_csv):
+    """Mock sessions for the list endpoints, built once per module.
+
+    Tests only read from these, so sharing them is safe; tests that assert
+    on call counts build their own. Response bodies live in tests/fixtures.
+    """
+    return {
+        "datasets": _canned_session(**{"json.return_value": datasets_json}),
+        "regions": _canned_session(text=regions_csv),
+        "vectors": _canned_session(text=vectors_csv),
+    }
+
+
+@pytest.fixture
+def in_memory_api_key(monkeypatch):
+    """Set an in-memory API key without going through set_api_key()."""
+    monkeypatch.setattr("pycancensus.settings._API_KEY", "test_key")
+
+
+@pytest.mark.usefixtures("in_memory_api_key")
 class TestMockedAPI:
     """Test API functions with mocked responses."""
 
     @patch("pycancensus.datasets.get_session")
-    def test_list_datasets(self, mock_get_session):
+    def test_list_datasets(self, mock_get_session, canned_sessions):
         """Test listing datasets with mocked API."""
-        # Mock API response
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "datasets": [
-                {"dataset": "CA16", "description": "2016 Census"},
-                {"dataset": "CA21", "description": "2021 Census"},
-            ]
-        }
-        mock_session = MagicMock()
-        mock_session.get.return_value = mock_response
-        mock_get_session.return_value = mock_session
-
-        # Set API key
-        pc.set_api_key("test_key")
+        mock_get_session.return_value = canned_sessions["datasets"]
 
         # Test function
         datasets = pc.list_census_datasets(use_cache=False)
@@ -160,21 +179,9 @@ class TestMockedAPI:
         assert "CA21" in datasets["dataset"].values
 
     @patch("pycancensus.regions.get_session")
-    def test_list_regions(self, mock_get_session):
+    def test_list_regions(self, mock_get_session, canned_sessions):
         """Test listing regions with mocked API."""
-        # Mock CSV response (new format)
-        csv_response = """name,geo_uid,type,population,flag,CMA_UID,CD_UID,PR_UID
-Vancouver,59933,CMA,2463431,,,59
-Toronto,35535,CMA,5928040,,,35"""
-
-        mock_response = MagicMock()
-        mock_response.text = csv_response
-        mock_session = MagicMock()
-        mock_session.get.return_value = mock_response
-        mock_get_session.return_value = mock_session
-
-        # Set API key
-        pc.set_api_key("test_key")
+        mock_get_session.return_value = canned_sessions["regions"]
 
         # Test function
         regions = pc.list_census_regions("CA16", use_cache=False)
@@ -185,21 +192,9 @@ Toronto,35535,CMA,5928040,,,35"""
         assert "Toronto" in regions["name"].values
 
     @patch("pycancensus.vectors.get_session")
-    def test_list_vectors(self, mock_get_session):
+    def test_list_vectors(self, mock_get_session, canned_sessions):
         """Test listing vectors with mocked API."""
-        # Mock CSV response (new format)
-        csv_response = """vector,label,type,units,add,parent,details
-v_CA16_1,Total population,Total,Number,additive,,Total population for region
-v_CA16_2,Total population Male,Male,Number,additive,v_CA16_1,Male population for region"""
-
-        mock_response = MagicMock()
-        mock_response.text = csv_response
-        mock_session = MagicMock()
-        mock_session.get.return_value = mock_response
-        mock_get_session.return_value = mock_session
-
-        # Set API key
-        pc.set_api_key("test_key")
+        mock_get_session.return_value = canned_sessions["vectors"]
 
         # Test function
         vectors = pc.list_census_vectors("CA16", use_cache=False)
@@ -220,7 +215,6 @@ v_CA16_2,Total population Male,Male,Number,additive,v_CA16_1,Male population for
         mock_session.get.return_value = mock_response
         mock_get_session.return_value = mock_session
 
-        pc.set_api_key("test_key")
         pc.list_census_datasets(use_cache=False)
 
         # Verify get_session was called (resilient session is used)
@@ -232,6 +226,47 @@ v_CA16_2,Total population Male,Male,Number,additive,v_CA16_1,Male population for
 class TestDataProcessing:
     """Test data processing functionality."""
 
+    @pytest.mark.parametrize("use_pyarrow", [True, False])
+    def test_read_census_csv_keeps_identifiers(self, use_pyarrow, monkeypatch):
+        """Test identifiers keep leading zeros on both CSV parser paths."""
+        import pycancensus.core as core
+
+        if use_pyarrow and core.pa is None:
+            pytest.skip("pyarrow not available")
+        if not use_pyarrow:
+            monkeypatch.setattr(core, "pa", None)
+
+        csv_data = """GeoUID,Type,Region Name,Population,"v_CA21_1: Total, pop"
+0101,CSD,"Saint-Jean, NB",1000,x
+9330001.01,CT,,F,
+"""
+
+        result = core._read_census_csv(csv_data)
+
+        assert result["GeoUID"].tolist() == ["0101", "9330001.01"]
+        assert result["Type"].dtype == "category"
+        assert result["Region Name"].dtype == "category"
+
+    def test_csv_parser_paths_agree(self, monkeypatch):
+        """Test the pyarrow and pandas CSV paths normalize identically."""
+        import pycancensus.core as core
+
+        if core.pa is None:
+            pytest.skip("pyarrow not available")
+
+        csv_data = """GeoUID,Type,Region Name,Population ,Households ,Area (sq km),v_CA21_1: Total,v_CA21_2
+0101,CSD,"F",662248,x,1.5,...,-
+5915,CMA,Vancouver,1,2,,3,
+"""
+
+        with_pyarrow = core._process_csv_response(csv_data, None, "detailed")
+        monkeypatch.setattr(core, "pa", None)
+        with_pandas = core._process_csv_response(csv_data, None, "detailed")
+
+        pd.testing.assert_frame_equal(with_pyarrow, with_pandas)
+        assert with_pandas["Region Name"].tolist()[0] == "F"
+        assert with_pandas["Population"].dtype == "int64"
+
     def test_column_name_handling_with_spaces(self):
         """Test that column names with trailing spaces are handled correctly."""
         from pycancensus.core import _process_csv_response
@@ -358,6 +393,100 @@ class TestDataProcessing:
         assert pd.isna(csv_result["Population"].iloc[1])
         assert pd.isna(geo_result["pop"].iloc[1])
 
+    @pytest.mark.parametrize(
+        "properties, feature_ids",
+        [
+            pytest.param(
+                [
+                    {"id": "0101", "pop": 1000, "dw": 500, "t": "CSD", "note": None},
+                    {"id": "0102", "pop": None, "dw": 600, "t": "CSD", "note": None},
+                ],
+                None,
+                id="census",
+            ),
+            pytest.param([{"v": 1}, {"v": 2}], ["T1", "T2"], id="feature-ids"),
+            pytest.param(
+                [{"id": "1", "d": "2021-05-01"}, {"id": "2", "d": "2021-06-01"}],
+                None,
+                id="date-strings",
+            ),
+            pytest.param(
+                [{"id": "1", "m": "abc"}, {"id": "2", "m": 5}],
+                None,
+                id="mixed-types",
+            ),
+        ],
+    )
+    @pytest.mark.parametrize("use_arrow", [True, False])
+    def test_read_geojson_response_matches_from_features(
+        self, monkeypatch, caplog, properties, feature_ids, use_arrow
+    ):
+        """Test the pyogrio reader returns the same frame as from_features."""
+        import json
+
+        pyogrio = pytest.importorskip("pyogrio")
+        import pycancensus.core as core
+
+        square = {
+            "type": "Polygon",
+            "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]],
+        }
+        features = []
+        for i, props in enumerate(properties):
+            feature = {"type": "Feature", "properties": props, "geometry": square}
+            if feature_ids:
+                feature["id"] = feature_ids[i]
+            features.append(feature)
+        data = {"type": "FeatureCollection", "features": features}
+        response = MagicMock()
+        response.content = json.dumps(data).encode()
+
+        if use_arrow and (core.pa is None or pyogrio.__gdal_version__ < (3, 6)):
+            pytest.skip("Arrow reading needs pyarrow and GDAL >= 3.6")
+        if not use_arrow:
+            monkeypatch.setattr(core, "pa", None)
+        with caplog.at_level(logging.DEBUG, logger="pycancensus.core"):
+            result = core._read_geojson_response(response, None, "detailed")
+        expected = core._process_geojson_response(data, None, "detailed")
+
+        # The debug log records which reader produced the frame
+        assert f"use_arrow={use_arrow}" in caplog.text
+
+        # Identifiers keep leading zeros, feature ids don't become a column,
+        # dates stay strings, and dtypes match, including all-null properties
+        assert result.crs == expected.crs
+        pd.testing.assert_frame_equal(pd.DataFrame(result), pd.DataFrame(expected))
+        response.json.assert_not_called()
+
+    def test_read_geojson_response_without_pyogrio(self, monkeypatch):
+        """Test the JSON fallback decodes the raw body when pyogrio is missing."""
+        import json
+
+        from pycancensus.core import _read_geojson_response, orjson
+
+        if orjson is None:
+            pytest.skip("orjson not available")
+
+        data = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "properties": {"id": "0101", "pop": 1000},
+                    "geometry": {"type": "Point", "coordinates": [-123.1, 49.3]},
+                }
+            ],
+        }
+        response = MagicMock()
+        response.content = json.dumps(data).encode()
+        monkeypatch.setitem(sys.modules, "pyogrio", None)
+
+        result = _read_geojson_response(response, None, "detailed")
+
+        assert result["id"].tolist() == ["0101"]
+        assert result["pop"].tolist() == [1000]
+        response.json.assert_not_called()
+
 
 class TestGeoVectorsMerge:
     """Test geo+vectors merge functionality."""
@@ -424,30 +553,113 @@ class TestGeoVectorsMerge:
 class TestCache:
     """Test caching functionality."""
 
-    def test_cache_operations(self):
+    def test_cache_operations(self, cache_dir):
         """Test basic cache operations."""
-        import tempfile
+        pc.set_cache_path(str(cache_dir / uuid.uuid4().hex))
+
+        # Test caching data
+        test_data = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+
+        from pycancensus.cache import cache_data, get_cached_data
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pc.set_cache_path(temp_dir)
+        # Cache data
+        cache_data("test_key", test_data)
 
-            # Test caching data
-            test_data = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+        # Retrieve cached data
+        retrieved_data = get_cached_data("test_key")
 
-            from pycancensus.cache import cache_data, get_cached_data
+        assert retrieved_data is not None
+        pd.testing.assert_frame_equal(test_data, retrieved_data)
 
-            # Cache data
-            cache_data("test_key", test_data)
+        # Test non-existent cache key
+        non_existent = get_cached_data("non_existent_key")
+        assert non_existent is None
 
-            # Retrieve cached data
-            retrieved_data = get_cached_data("test_key")
+    def test_cache_formats(self, cache_dir):
+        """Test DataFrames use parquet and everything else falls back to pickle."""
+        from pathlib import Path
+
+        from pycancensus.cache import cache_data, get_cached_data, pyarrow
+
+        if pyarrow is None:
+            pytest.skip("pyarrow not available")
+
+        cache_path = cache_dir / uuid.uuid4().hex
+        pc.set_cache_path(str(cache_path))
+
+        frame = pd.DataFrame({"GeoUID": ["0101"], "v_CA21_1": [1.5]})
+        frame["Type"] = pd.Categorical(["CSD"])
+        # The string dtype before pandas 3; must still be written as parquet
+        strings = pd.DataFrame(
+            {"GeoUID": pd.Series(["0101", None], dtype=object), "v": [1.0, 2.0]}
+        )
+        mixed = pd.DataFrame({"col": pd.Series([1, "a"], dtype=object)})
+        cache_data("frame", frame)
+        cache_data("strings", strings)
+        cache_data("mixed", mixed)
+        cache_data("dict", {"a": 1})
+
+        assert sorted(path.name for path in Path(cache_path).iterdir()) == [
+            "dict.pkl",
+            "frame.parquet",
+            "mixed.pkl",
+            "strings.parquet",
+        ]
+        pd.testing.assert_frame_equal(get_cached_data("frame"), frame)
+        pd.testing.assert_frame_equal(get_cached_data("strings"), strings)
+        pd.testing.assert_frame_equal(get_cached_data("mixed"), mixed)
+        assert get_cached_data("dict") == {"a": 1}
+
+        pc.remove_from_cache(["frame"])
+        assert get_cached_data("frame") is None
+
+    def test_list_cache_reads_metadata_sidecars(self, cache_dir):
+        """Test list_cache reports each entry once, with metadata if recorded."""
+        from pycancensus.cache import cache_data
+
+        cache_path = cache_dir / uuid.uuid4().hex
+        pc.set_cache_path(str(cache_path))
 
-            assert retrieved_data is not None
-            pd.testing.assert_frame_equal(test_data, retrieved_data)
+        cache_data("plain", {"a": 1})
+        cache_data("census", pd.DataFrame({"v": [1.0]}), metadata={"dataset": "CA21"})
+
+        listing = pc.list_cache()
+
+        assert listing["cache_key"].tolist() == ["census", "plain"]
+        assert listing["dataset"].tolist()[0] == "CA21"
+        assert pd.isna(listing["dataset"].tolist()[1])
+
+    def test_cache_geodataframe_as_parquet(self, cache_dir):
+        """Test GeoDataFrames round-trip through the parquet cache."""
+        gpd = pytest.importorskip("geopandas")
+        from shapely.geometry import Point
+
+        from pycancensus.cache import cache_data, get_cached_data, pyarrow
+
+        if pyarrow is None:
+            pytest.skip("pyarrow not available")
+
+        cache_path = cache_dir / uuid.uuid4().hex
+        pc.set_cache_path(str(cache_path))
+
+        # Explicit dtypes: object strings (the pre-pandas-3 default) must not
+        # force the pickle fallback
+        frame = gpd.GeoDataFrame(
+            {
+                "GeoUID": pd.Series(["0101"], dtype=object),
+                "Type": pd.Categorical(["CSD"]),
+                "v_CA21_1": pd.Series([1.5], dtype="float64"),
+            },
+            geometry=[Point(-123.1, 49.3)],
+            crs="EPSG:4326",
+        )
+        cache_data("geo", frame)
 
-            # Test non-existent cache key
-            non_existent = get_cached_data("non_existent_key")
-            assert non_existent is None
+        assert (cache_path / "geo.parquet").exists()
+        cached = get_cached_data("geo")
+        assert isinstance(cached, gpd.GeoDataFrame)
+        assert cached.crs == frame.crs
+        pd.testing.assert_frame_equal(cached, frame)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,14 @@
 """Tests for get_census cache semantics and response validation."""
 
+import json
+import threading
+from concurrent.futures import Future
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
 
-from pycancensus.core import get_census, _process_csv_response
+from pycancensus.core import get_census, _process_csv_response, _single_flight
 
 VALID_CSV = 'GeoUID,Type,"Region Name",Population\n' '5915022,CSD,"Vancouver",662248\n'
 
@@ -76,3 +79,151 @@ class TestCsvValidation:
     def test_valid_csv_accepted(self):
         result = _process_csv_response(VALID_CSV, None, "detailed")
         assert result["GeoUID"].tolist() == ["5915022"]
+
+
+class TestDowncast:
+    @patch("pycancensus.core.cache_data")
+    @patch("pycancensus.core.get_cached_data", return_value=None)
+    @patch("pycancensus.core.get_session")
+    @patch("pycancensus.core.get_api_key", return_value="test_key")
+    def test_downcast_narrows_result_but_not_cache(
+        self, mock_key, mock_get_session, mock_read, mock_write
+    ):
+        session = MagicMock()
+        session.post.return_value = make_response(VALID_CSV)
+        mock_get_session.return_value = session
+
+        result = get_census("CA21", {"CSD": "5915022"}, quiet=True, downcast=True)
+
+        assert result["Population"].dtype == "int32"
+        assert result["Population"].iloc[0] == 662248
+        cached = mock_write.call_args[0][1]
+        assert cached["Population"].dtype == "int64"
+
+    @patch("pycancensus.core.get_cached_data")
+    @patch("pycancensus.core.get_api_key", return_value="test_key")
+    def test_downcast_keeps_values_that_do_not_fit(self, mock_key, mock_read):
+        mock_read.return_value = pd.DataFrame(
+            {
+                "GeoUID": ["1", "2"],
+                "Population": [1, 2**40],
+                "Area (sq km)": [10.5432, 2.0],
+                "v_CA21_1": [1.0, float("nan")],
+            }
+        )
+
+        with patch("pycancensus.recalls.check_recalled_data_and_warn"):
+            result = get_census("CA21", {"PR": "59"}, quiet=True, downcast=True)
+
+        assert result["Population"].dtype == "int64"
+        assert result["Area (sq km)"].dtype == "float64"
+        assert result["v_CA21_1"].dtype == "float32"
+
+
+class TestArrayLikeVectors:
+    @patch("pycancensus.core.cache_data")
+    @patch("pycancensus.core.get_cached_data", return_value=None)
+    @patch("pycancensus.core.get_session")
+    @patch("pycancensus.core.get_api_key", return_value="test_key")
+    def test_series_and_array_match_list(
+        self, mock_key, mock_get_session, mock_read, mock_write
+    ):
+        session = MagicMock()
+        session.post.return_value = make_response(VALID_CSV)
+        mock_get_session.return_value = session
+        ids = ["v_CA21_1", "v_CA21_2"]
+
+        for vectors in (ids, pd.Series(ids), pd.Series(ids).to_numpy()):
+            get_census("CA21", {"CSD": "5915022"}, vectors=vectors, quiet=True)
+
+        bodies = [
+            call.kwargs["files"]["vectors"][1] for call in session.post.call_args_list
+        ]
+        assert bodies == [json.dumps(ids)] * 3
+        cache_keys = {call.args[0] for call in mock_read.call_args_list}
+        assert len(cache_keys) == 1
+
+
+class TestSingleFlight:
+    @patch("pycancensus.core.cache_data")
+    @patch("pycancensus.core.get_cached_data", return_value=None)
+    @patch("pycancensus.core.get_session")
+    @patch("pycancensus.core.get_api_key", return_value="test_key")
+    def test_concurrent_identical_requests_share_one_download(
+        self, mock_key, mock_get_session, mock_read, mock_write
+    ):
+        release = threading.Event()
+        waiting = threading.Event()
+
+        class ObservedFuture(Future):
+            def result(self, timeout=None):
+                waiting.set()
+                return super().result(timeout)
+
+        def slow_post(*args, **kwargs):
+            release.wait(5)
+            return make_response(VALID_CSV)
+
+        session = MagicMock()
+        session.post.side_effect = slow_post
+        mock_get_session.return_value = session
+
+        results = {}
+
+        def fetch(name):
+            results[name] = get_census("CA21", {"CSD": "5915022"}, quiet=True)
+
+        with patch("pycancensus.core.Future", ObservedFuture):
+            leader = threading.Thread(target=fetch, args=("leader",))
+            leader.start()
+            follower = threading.Thread(target=fetch, args=("follower",))
+            follower.start()
+            assert waiting.wait(5)  # follower is blocked on the leader
+            release.set()
+            leader.join(5)
+            follower.join(5)
+
+        assert session.post.call_count == 1
+        mock_write.assert_called_once()
+        pd.testing.assert_frame_equal(results["leader"], results["follower"])
+        assert results["leader"] is not results["follower"]
+
+    def test_waiters_do_not_see_leader_mutations(self):
+        started = threading.Event()
+        release = threading.Event()
+        waiting = threading.Event()
+        mutated = threading.Event()
+
+        class ObservedFuture(Future):
+            def result(self, timeout=None):
+                waiting.set()
+                mutated.wait(5)  # copy only after the leader's caller mutated
+                return super().result(timeout)
+
+        def fetch():
+            started.set()
+            release.wait(5)
+            return pd.DataFrame({"v": [1.0]})
+
+        results = {}
+
+        def lead():
+            results["leader"] = _single_flight("key", fetch)
+            results["leader"]["v"] = 99.0
+            mutated.set()
+
+        def follow():
+            results["follower"] = _single_flight("key", fetch)
+
+        with patch("pycancensus.core.Future", ObservedFuture):
+            leader = threading.Thread(target=lead)
+            leader.start()
+            assert started.wait(5)  # the leader owns the in-flight entry
+            follower = threading.Thread(target=follow)
+            follower.start()
+            assert waiting.wait(5)
+            release.set()
+            leader.join(5)
+            follower.join(5)
+
+        assert results["follower"]["v"].tolist() == [1.0]
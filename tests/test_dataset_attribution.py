@@ -55,6 +55,7 @@ class TestDatasetAttribution:
         result2 = pc.dataset_attribution(["CA16"])
         assert result1 == result2
 
+    @pytest.mark.serial
     @pytest.mark.skipif(
         not os.environ.get("RUN_R_TESTS", False), reason="R tests not enabled"
     )
@@ -155,7 +155,11 @@ class TestIntersectingGeometries:
         """Test with invalid geometry input."""
         with pytest.raises(ValueError, match="geometry parameter must be"):
             pc.get_intersecting_geometries(
-                dataset="CA21", level="CT", geometry="invalid", quiet=True
+                dataset="CA21",
+                level="CT",
+                geometry="invalid",
+                quiet=True,
+                api_key="test_key",
             )
 
     def test_caching(self):
@@ -37,6 +37,15 @@ class TestAsCensusRegionList:
         df = pd.DataFrame({"region": [59, 35], "level": ["PR", "PR"]})
         assert as_census_region_list(df) == {"PR": ["59", "35"]}
 
+    def test_categorical_level_skips_unused_categories(self):
+        df = pd.DataFrame(
+            {
+                "region": ["59", "35"],
+                "level": pd.Categorical(["PR", "PR"], categories=["PR", "CMA", "CSD"]),
+            }
+        )
+        assert as_census_region_list(df) == {"PR": ["59", "35"]}
+
     def test_missing_columns_raises(self):
         with pytest.raises(ValueError, match="list_census_regions"):
             as_census_region_list(pd.DataFrame({"GeoUID": ["59"]}))
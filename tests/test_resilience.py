@@ -1,5 +1,7 @@
 """Tests for retry and error handling in pycancensus.resilience."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,6 +13,8 @@ from pycancensus.resilience import (
     DataNotFoundError,
     RateLimitError,
     ResilientSession,
+    close_session,
+    get_session,
 )
 
 
@@ -155,3 +159,45 @@ class TestRetryAfter:
             session.request("GET", "https://example.com")
 
         assert excinfo.value.retry_after == 17
+
+
+class TestConcurrency:
+    """The shared session can be used from several threads at once."""
+
+    def test_get_session_returns_one_instance_across_threads(self):
+        close_session()
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                sessions = list(executor.map(lambda _: get_session(), range(32)))
+            assert all(session is sessions[0] for session in sessions)
+        finally:
+            close_session()
+
+    def test_close_session_is_public_and_resets_the_shared_session(self):
+        import pycancensus as pc
+
+        first = get_session()
+        assert get_session() is first  # keep-alive session is reused
+        pc.close_session()
+        try:
+            assert get_session() is not first
+        finally:
+            close_session()
+
+    @patch("pycancensus.resilience.time.sleep")
+    @patch("pycancensus.resilience.time.time", return_value=1000.0)
+    def test_rate_limit_spaces_concurrent_callers(self, mock_time, mock_sleep):
+        session = ResilientSession()
+        start = threading.Barrier(4)
+
+        def call():
+            start.wait()
+            session._enforce_rate_limit()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(call) for _ in range(4)]:
+                future.result()
+
+        # With the clock frozen, each caller gets its own 100ms slot
+        waits = sorted(c.args[0] for c in mock_sleep.call_args_list)
+        assert waits == pytest.approx([0.1, 0.2, 0.3])
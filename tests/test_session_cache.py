@@ -3,7 +3,6 @@
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
-import pytest
 
 import pycancensus.cache as cache_mod
 from pycancensus.cache import (
@@ -11,16 +10,10 @@ from pycancensus.cache import (
     session_cache_get,
     session_cache_set,
 )
+from pycancensus.datasets import dataset_attribution
 from pycancensus.vectors import list_census_vectors
 
 
-@pytest.fixture(autouse=True)
-def clean_session_cache():
-    cache_mod._session_cache.clear()
-    yield
-    cache_mod._session_cache.clear()
-
-
 def make_vectors_df():
     return pd.DataFrame(
         {
@@ -129,3 +122,38 @@ class TestListVectorsSessionCache:
         list_census_vectors("CA21", quiet=True, use_cache=False)
 
         assert session.get.call_count == 2
+
+
+class TestListDatasetsSessionCache:
+    @patch("pycancensus.datasets.get_session")
+    @patch("pycancensus.datasets.get_cached_data", return_value=None)
+    @patch("pycancensus.datasets.cache_data")
+    @patch("pycancensus.datasets.get_api_key", return_value="test_key")
+    def test_attribution_calls_share_one_dataset_lookup(
+        self, mock_key, mock_cache_write, mock_file_cache, mock_get_session
+    ):
+        response = MagicMock()
+        response.json.return_value = [
+            {
+                "dataset": "CA16",
+                "description": "2016 Census",
+                "attribution": "Statistics Canada 2016 Census",
+            },
+            {
+                "dataset": "CA21",
+                "description": "2021 Census",
+                "attribution": "Statistics Canada 2021 Census",
+            },
+        ]
+        session = MagicMock()
+        session.get.return_value = response
+        mock_get_session.return_value = session
+
+        first = dataset_attribution(["CA16"])
+        second = dataset_attribution(["ca16"])
+        merged = dataset_attribution(["CA16", "CA21"])
+
+        assert session.get.call_count == 1  # API hit only once
+        assert mock_file_cache.call_count == 1  # file cache read only once
+        assert first == second == ["Statistics Canada 2016 Census"]
+        assert merged == ["Statistics Canada 2016, 2021 Census"]